@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, Platform
-from homeassistant.core import CoreState, Event, HomeAssistant
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
 
 from .ceiling_fan_controller import CeilingFanController
 from .const import DOMAIN, Config, ControllerType
@@ -18,6 +18,13 @@ from .smart_controller import SmartController
 
 PLATFORMS = [Platform.BINARY_SENSOR]
 
+_CONTROLLER_FACTORIES: dict[ControllerType, type[SmartController]] = {
+    ControllerType.CEILING_FAN: CeilingFanController,
+    ControllerType.EXHAUST_FAN: ExhaustFanController,
+    ControllerType.LIGHT: LightController,
+    ControllerType.OCCUPANCY: OccupancyController,
+}
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -29,13 +36,28 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     domain_data[config_entry.entry_id] = controller
 
-    async def start_controller(_: Event | None = None):
-        await controller.async_setup(hass)
-
     if hass.state == CoreState.running:
-        await start_controller()
+        await controller.async_setup(hass)
     else:
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, start_controller)
+        # Register a synchronous callback so the controller setup task is
+        # created at dispatch time instead of scheduling a coroutine listener
+        # through the event loop first. The listener removes itself when the
+        # event fires and is also removed on unload, so reloading the entry
+        # before startup completes cannot leak it.
+        @callback
+        def start_controller(_: Event) -> None:
+            remove_start_listener()
+            hass.async_create_task(controller.async_setup(hass))
+
+        remove = hass.bus.async_listen(EVENT_HOMEASSISTANT_STARTED, start_controller)
+
+        def remove_start_listener() -> None:
+            nonlocal remove
+            if remove is not None:
+                remove()
+                remove = None
+
+        config_entry.async_on_unload(remove_start_listener)
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
     config_entry.async_on_unload(config_entry.add_update_listener(async_reload_entry))
@@ -67,14 +89,7 @@ def _create_controller(
     hass: HomeAssistant, config_entry: ConfigEntry
 ) -> SmartController | None:
     type_ = config_entry.data[Config.CONTROLLER_TYPE]
-    match type_:
-        case ControllerType.CEILING_FAN:
-            return CeilingFanController(hass, config_entry)
-        case ControllerType.EXHAUST_FAN:
-            return ExhaustFanController(hass, config_entry)
-        case ControllerType.LIGHT:
-            return LightController(hass, config_entry)
-        case ControllerType.OCCUPANCY:
-            return OccupancyController(hass, config_entry)
-
-    raise TypeError(f"Invalid controller type: {type_}")
+    if (factory := _CONTROLLER_FACTORIES.get(type_)) is None:
+        raise TypeError(f"Invalid controller type: {type_}")
+
+    return factory(hass, config_entry)
@@ -7,19 +7,20 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, Config, ControllerType
-from .entity import SmartControllerEntity
+from .entity import SmartControllerEntity, async_get_sw_version
 from .smart_controller import SmartController
 
-ENTITY_DESCRIPTIONS = [
-    BinarySensorEntityDescription(
+ENTITY_DESCRIPTIONS = {
+    ControllerType.OCCUPANCY: BinarySensorEntityDescription(
         key=ControllerType.OCCUPANCY,
         device_class=BinarySensorDeviceClass.OCCUPANCY,
         icon="mdi:account",
     ),
-]
+}
 
 
 async def async_setup_entry(
@@ -29,17 +30,21 @@ async def async_setup_entry(
     controller = hass.data[DOMAIN][config_entry.entry_id]
     type_ = config_entry.data[Config.CONTROLLER_TYPE]
 
-    async_add_entities(
-        [
-            SmartControllerBinarySensor(
-                controller=controller,
-                entity_description=entity_description,
-                name=config_entry.title,
-            )
-            for entity_description in ENTITY_DESCRIPTIONS
-            if entity_description.key == type_
-        ]
-    )
+    if (entity_description := ENTITY_DESCRIPTIONS.get(type_)) is not None:
+        # resolved before the entity exists so the device is registered
+        # with its version on the first device_info read
+        sw_version = await async_get_sw_version(hass)
+
+        async_add_entities(
+            [
+                SmartControllerBinarySensor(
+                    controller=controller,
+                    entity_description=entity_description,
+                    name=config_entry.title,
+                    sw_version=sw_version,
+                )
+            ]
+        )
 
 
 class SmartControllerBinarySensor(SmartControllerEntity, BinarySensorEntity):
@@ -50,13 +55,18 @@ class SmartControllerBinarySensor(SmartControllerEntity, BinarySensorEntity):
         controller: SmartController,
         entity_description: BinarySensorEntityDescription,
         name: str,
+        sw_version: str | None,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(controller)
+        super().__init__(controller, sw_version)
         self.entity_description = entity_description
         self._attr_name = name
 
-    @property
-    def is_on(self):
-        """Return the status of the sensor."""
-        return self.controller.is_on
+    # #### Internal methods ####
+
+    @callback
+    def _update_callback(self) -> None:
+        """Load data from controller."""
+        # cache is_on so reads don't delegate to the controller every time
+        self._attr_is_on = self.controller.is_on
+        super()._update_callback()
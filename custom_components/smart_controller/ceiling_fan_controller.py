@@ -1,52 +1,97 @@
 """Representation of a Ceiling Fan Controller."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from enum import IntEnum
+from logging import DEBUG
+from typing import Final
 
-from homeassistant.backports.enum import StrEnum
-from homeassistant.components.fan import (
-    ATTR_PERCENTAGE,
-    ATTR_PERCENTAGE_STEP,
-    SERVICE_SET_PERCENTAGE,
-)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, Platform
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.event import async_track_time_interval
 
-from .const import _LOGGER, ON_OFF_STATES, Config
+from .const import (
+    _LOGGER,
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    IGNORE_STATES,
+    ON_OFF_STATES,
+    Config,
+)
 from .smart_controller import SmartController
 from .util import extrapolate_value, float_with_unit, remove_empty, summer_simmer_index
 
+# temperature and humidity sensors often publish milliseconds apart;
+# coalesce such bursts into a single refresh
+_REFRESH_DEBOUNCE_SECONDS: Final = 0.25
+
+
+class MyState(IntEnum):
+    """State machine states.
 
-class MyState(StrEnum):
-    """State machine states."""
+    Integer-valued so (state, event) dispatch hashes and compares ints.
+    """
 
-    INIT = "init"
-    OFF = "off"
-    ON = "on"
-    ON_MANUAL = "on_manual"
-    OFF_MANUAL = "off_manual"
+    INIT = 0
+    OFF = 1
+    ON = 2
+    ON_MANUAL = 3
+    OFF_MANUAL = 4
 
+    def __str__(self) -> str:
+        """Return the lowercase member name for logging."""
+        return self.name.lower()
 
-class MyEvent(StrEnum):
+
+class MyEvent(IntEnum):
     """State machine events."""
 
-    OFF = "off"
-    ON = "on"
-    TIMER = "timer"
-    REFRESH = "refresh"
+    OFF = 0
+    ON = 1
+    TIMER = 2
+    REFRESH = 3
+
+    def __str__(self) -> str:
+        """Return the lowercase member name for logging."""
+        return self.name.lower()
 
 
 class CeilingFanController(SmartController):
     """Representation of a Ceiling Fan Controller."""
 
+    __slots__ = (
+        "temp_sensor",
+        "humidity_sensor",
+        "_temp_unit",
+        "ssi_range",
+        "speed_range",
+        "_manual_control_period",
+        "_on_target",
+        "_off_target",
+        "_required",
+        "_required_states",
+        "_temp_value",
+        "_temp_state_unit",
+        "_humidity_value",
+        "_pending_refresh",
+        "_last_ssi_inputs",
+        "_last_ssi_outputs",
+        "_last_applied_speed",
+        "_speed_step",
+        "_inv_speed_step",
+        "_state_change_handlers",
+    )
+
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the controller."""
         super().__init__(hass, config_entry, MyState.INIT)
 
         self.temp_sensor: str = self.data[Config.TEMP_SENSOR]
         self.humidity_sensor: str = self.data[Config.HUMIDITY_SENSOR]
+        # the unit system cannot change without a restart, so resolve the
+        # attribute chain once instead of on every temperature update
+        self._temp_unit: str = hass.config.units.temperature_unit
 
         self.ssi_range = (
             float(self.data[Config.SSI_MIN]),
@@ -64,6 +109,14 @@ class CeilingFanController(SmartController):
             if manual_control_minutes
             else None
         )
+        # target states for manual transitions, resolved once instead of
+        # re-testing the manual-control period on every transition
+        self._on_target = (
+            MyState.ON_MANUAL if self._manual_control_period else MyState.ON
+        )
+        self._off_target = (
+            MyState.OFF_MANUAL if self._manual_control_period else MyState.OFF
+        )
 
         required_on_entities: list[str] = self.data.get(Config.REQUIRED_ON_ENTITIES, [])
         required_off_entities: list[str] = self.data.get(
@@ -75,83 +128,255 @@ class CeilingFanController(SmartController):
         }
         self._required_states: dict[str, str | None] = {k: None for k in self._required}
 
-        self._temp: tuple[float, str] | None = None
-        self._humidity: tuple[float, str] | None = None
-
-        self.tracked_entity_ids = remove_empty(
-            [
-                self.controlled_entity,
-                self.temp_sensor,
-                self.humidity_sensor,
-                *self._required,
-            ]
+        # scalar sensor readings; kept unpacked so the hot path needs no
+        # tuple indexing
+        self._temp_value: float | None = None
+        self._temp_state_unit: str | None = None
+        self._humidity_value: float | None = None
+        self._pending_refresh: asyncio.TimerHandle | None = None
+        # last SSI computation, keyed by its inputs; watchdog polls and
+        # no-op refreshes reuse it instead of redoing the float math
+        self._last_ssi_inputs: tuple[float, str, float] | None = None
+        self._last_ssi_outputs: tuple[float, float] | None = None
+        # speed last applied by this controller; None when the fan may have
+        # been changed externally
+        self._last_applied_speed: int | None = None
+        # percentage step is a static fan capability; read it once and keep
+        # the reciprocal so quantizing is a multiply instead of a divide
+        self._speed_step: float | None = None
+        self._inv_speed_step: float | None = None
+
+        # frozen so membership tests are O(1) and the tracked set cannot
+        # drift after subscriptions are established
+        self.tracked_entity_ids = frozenset(
+            remove_empty(
+                [
+                    self.controlled_entity,
+                    self.temp_sensor,
+                    self.humidity_sensor,
+                    *self._required,
+                ]
+            )
         )
 
+        # O(1) per-entity dispatch; the controlled entity is assigned last
+        # so it wins if it also appears in another role
+        self._state_change_handlers: dict[
+            str, Callable[[State], Awaitable[None]]
+        ] = {entity_id: self._on_required_change for entity_id in self._required}
+        self._state_change_handlers[self.temp_sensor] = self._on_temp_change
+        self._state_change_handlers[self.humidity_sensor] = self._on_humidity_change
+        if self.controlled_entity:
+            self._state_change_handlers[self.controlled_entity] = self._on_fan_change
+
     async def async_setup(self, hass) -> None:
         """Additional setup unique to this controller."""
+        # imported lazily so installs without fan controllers never pay
+        # for it at startup
+        from homeassistant.helpers.event import async_track_time_interval
+
         await super().async_setup(hass)
-        self._unsubscribers.append(
-            async_track_time_interval(hass, self._on_poll, timedelta(seconds=60))
+
+        # updates are push-driven; only fall back to a watchdog poll when a
+        # sensor was missing or unavailable at setup (degraded mode)
+        states_get = hass.states.get
+        degraded = any(
+            (state := states_get(entity_id)) is None
+            or state.state in IGNORE_STATES
+            for entity_id in (self.temp_sensor, self.humidity_sensor)
         )
+        if degraded:
+            poll_interval = timedelta(seconds=DEFAULT_POLL_INTERVAL_SECONDS)
+            _LOGGER.warning(
+                "%s; a sensor is missing or unavailable; polling every %s",
+                self.name,
+                poll_interval,
+            )
+            self._add_unsubscriber(
+                async_track_time_interval(hass, self._on_poll, poll_interval)
+            )
+
         await self.fire_event(MyEvent.REFRESH)
 
     async def on_state_change(self, state: State) -> None:
         """Handle entity state changes from base."""
-        if state.entity_id == self.controlled_entity and state.state in ON_OFF_STATES:
+        if (handler := self._state_change_handlers.get(state.entity_id)) is not None:
+            await handler(state)
+
+    async def _on_fan_change(self, state: State) -> None:
+        from homeassistant.components.fan import ATTR_PERCENTAGE_STEP
+
+        step = state.attributes.get(ATTR_PERCENTAGE_STEP)
+        if step is not None and step != self._speed_step:
+            self._speed_step = step
+            self._inv_speed_step = 1 / step
+        if state.state in ON_OFF_STATES:
+            self._last_applied_speed = None
             await self.fire_event(
                 MyEvent.ON if state.state == STATE_ON else MyEvent.OFF
             )
 
-        elif state.entity_id == self.temp_sensor:
-            self._temp = float_with_unit(state, self.hass.config.units.temperature_unit)
+    async def _on_temp_change(self, state: State) -> None:
+        self._temp_value, self._temp_state_unit = float_with_unit(
+            state, self._temp_unit
+        )
+        self._schedule_refresh()
 
-        elif state.entity_id == self.humidity_sensor:
-            self._humidity = float_with_unit(state, PERCENTAGE)
+    async def _on_humidity_change(self, state: State) -> None:
+        self._humidity_value = float_with_unit(state, PERCENTAGE)[0]
+        self._schedule_refresh()
 
-        elif state.entity_id in self._required_states:
-            if state.state in ON_OFF_STATES:
-                self._required_states[state.entity_id] = state.state
-                await self.fire_event(MyEvent.REFRESH)
+    async def _on_required_change(self, state: State) -> None:
+        if state.state in ON_OFF_STATES:
+            self._required_states[state.entity_id] = state.state
+            self._schedule_refresh()
 
     async def on_timer_expired(self) -> None:
         """Handle timer expiration from base."""
         await self.fire_event(MyEvent.TIMER)
 
+    def async_unload(self) -> None:
+        """Call when controller is being unloaded."""
+        if self._pending_refresh is not None:
+            self._pending_refresh.cancel()
+            self._pending_refresh = None
+        super().async_unload()
+
+    def _schedule_refresh(self) -> None:
+        """Schedule a refresh, coalescing bursts of sensor updates."""
+        if self._pending_refresh is not None:
+            self._pending_refresh.cancel()
+        self._pending_refresh = self.hass.loop.call_later(
+            _REFRESH_DEBOUNCE_SECONDS, self._refresh_expired
+        )
+
+    def _refresh_expired(self) -> None:
+        self._pending_refresh = None
+        self.hass.async_create_task(self.fire_event(MyEvent.REFRESH))
+
     async def _on_poll(self, _: datetime) -> None:
-        _LOGGER.debug("%s; state=%s; polling for changes", self.name, self._state)
+        if _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug("%s; state=%s; polling for changes", self.name, self._state)
         await self.fire_event(MyEvent.REFRESH)
 
     async def on_event(self, event: MyEvent) -> None:
         """Handle controller events."""
+        if (handler := self._TRANSITIONS.get((self._state, event))) is not None:
+            await handler(self)
+        elif _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug(
+                "%s; state=%s; ignored '%s' event",
+                self.name,
+                self._state,
+                event,
+            )
+
+    async def _handle_initial_off(self) -> None:
+        self.set_state(MyState.OFF)
+
+    async def _handle_initial_on(self) -> None:
+        self.set_state(MyState.ON)
+
+    async def _handle_manual_on(self) -> None:
+        self.set_state(self._on_target)
+        self.set_timer(self._manual_control_period)
+
+    async def _handle_manual_off(self) -> None:
+        self.set_state(self._off_target)
+        self.set_timer(self._manual_control_period)
+
+    async def _handle_refresh_while_off(self) -> None:
+        if await self._update_fan_speed():
+            self.set_state(MyState.ON)
+
+    async def _handle_refresh_while_on(self) -> None:
+        if not await self._update_fan_speed():
+            self.set_state(MyState.OFF)
+
+    async def _handle_manual_canceled(self) -> None:
+        self.set_timer(None)
+        await self._handle_manual_expired()
+
+    async def _handle_manual_expired(self) -> None:
+        fan_on = await self._update_fan_speed()
+        self.set_state(MyState.ON if fan_on else MyState.OFF)
+
+    # constant-time (state, event) dispatch instead of sequential
+    # structural pattern matches
+    _TRANSITIONS = {
+        (MyState.INIT, MyEvent.OFF): _handle_initial_off,
+        (MyState.INIT, MyEvent.ON): _handle_initial_on,
+        (MyState.OFF, MyEvent.ON): _handle_manual_on,
+        (MyState.OFF, MyEvent.REFRESH): _handle_refresh_while_off,
+        (MyState.ON, MyEvent.OFF): _handle_manual_off,
+        (MyState.ON, MyEvent.REFRESH): _handle_refresh_while_on,
+        (MyState.OFF_MANUAL, MyEvent.ON): _handle_manual_canceled,
+        (MyState.OFF_MANUAL, MyEvent.TIMER): _handle_manual_expired,
+        (MyState.ON_MANUAL, MyEvent.OFF): _handle_manual_canceled,
+        (MyState.ON_MANUAL, MyEvent.TIMER): _handle_manual_expired,
+    }
+
+    async def _update_fan_speed(self) -> bool:
+        from homeassistant.components.fan import (
+            ATTR_PERCENTAGE,
+            ATTR_PERCENTAGE_STEP,
+            SERVICE_SET_PERCENTAGE,
+        )
 
-        async def update_fan_speed() -> bool:
-            if self._temp is None or self._humidity is None:
-                return False
+        if self._temp_value is None or self._humidity_value is None:
+            return False
 
-            ssi = summer_simmer_index(self.hass, self._temp, self._humidity[0])
+        assert self._temp_state_unit
+
+        inputs = (self._temp_value, self._temp_state_unit, self._humidity_value)
+        if inputs == self._last_ssi_inputs and self._last_ssi_outputs:
+            ssi, ssi_speed = self._last_ssi_outputs
+        else:
+            ssi = summer_simmer_index(
+                self.hass,
+                (self._temp_value, self._temp_state_unit),
+                self._humidity_value,
+            )
             ssi_speed = extrapolate_value(
                 ssi, self.ssi_range, self.speed_range, low_default=0
             )
+            self._last_ssi_inputs = inputs
+            self._last_ssi_outputs = (ssi, ssi_speed)
+
+        # bail out before touching the state machine when the required
+        # entities already force the speed we last applied
+        required_met = self._required_states == self._required
+        if not required_met and self._last_applied_speed == 0:
+            return False
 
-            assert self.controlled_entity
-            fan_state = self.hass.states.get(self.controlled_entity)
+        assert self.controlled_entity
+        fan_state = self.hass.states.get(self.controlled_entity)
 
-            assert fan_state
+        assert fan_state
+        if (speed_step := self._speed_step) is None:
             speed_step = fan_state.attributes.get(ATTR_PERCENTAGE_STEP, 100)
+            self._speed_step = speed_step
+            self._inv_speed_step = 1 / speed_step
 
-            curr_speed = int(
-                fan_state.attributes.get(ATTR_PERCENTAGE, 100)
-                if fan_state.state == STATE_ON
-                else 0
-            )
+        curr_speed = int(
+            fan_state.attributes.get(ATTR_PERCENTAGE, 100)
+            if fan_state.state == STATE_ON
+            else 0
+        )
 
-            new_speed = (
-                int(round(int(ssi_speed / speed_step) * speed_step, 3))
-                if self._required_states == self._required
-                else 0
-            )
+        # quantize to the nearest step and round the way the fan reports
+        # percentages, so new_speed compares equal to curr_speed once applied
+        new_speed = (
+            round(round(ssi_speed * self._inv_speed_step) * speed_step)
+            if required_met
+            else 0
+        )
 
-            if new_speed != curr_speed:
+        if new_speed == self._last_applied_speed == curr_speed:
+            return new_speed > 0
+
+        if new_speed != curr_speed:
+            if _LOGGER.isEnabledFor(DEBUG):
                 _LOGGER.debug(
                     "%s; state=%s; changing speed to %d percent for SSI=%.1f",
                     self.name,
@@ -160,63 +385,13 @@ class CeilingFanController(SmartController):
                     ssi,
                 )
 
-                await self.async_service_call(
-                    Platform.FAN,
-                    SERVICE_SET_PERCENTAGE,
-                    {ATTR_PERCENTAGE: new_speed},
-                )
-
-            return new_speed > 0
-
-        match (self._state, event):
-            case (MyState.INIT, MyEvent.OFF):
-                self.set_state(MyState.OFF)
-
-            case (MyState.INIT, MyEvent.ON):
-                self.set_state(MyState.ON)
-
-            case (MyState.OFF, MyEvent.ON):
-                self.set_state(
-                    MyState.ON_MANUAL if self._manual_control_period else MyState.ON
-                )
-                self.set_timer(self._manual_control_period)
-
-            case (MyState.OFF, MyEvent.REFRESH):
-                if fan_on := await update_fan_speed():
-                    self.set_state(MyState.ON)
-
-            case (MyState.ON, MyEvent.OFF):
-                self.set_state(
-                    MyState.OFF_MANUAL if self._manual_control_period else MyState.OFF
-                )
-                self.set_timer(self._manual_control_period)
-
-            case (MyState.ON, MyEvent.REFRESH):
-                if not (fan_on := await update_fan_speed()):
-                    self.set_state(MyState.OFF)
-
-            case (MyState.OFF_MANUAL, MyEvent.ON):
-                self.set_timer(None)
-                fan_on = await update_fan_speed()
-                self.set_state(MyState.ON if fan_on else MyState.OFF)
-
-            case (MyState.OFF_MANUAL, MyEvent.TIMER):
-                fan_on = await update_fan_speed()
-                self.set_state(MyState.ON if fan_on else MyState.OFF)
-
-            case (MyState.ON_MANUAL, MyEvent.OFF):
-                self.set_timer(None)
-                fan_on = await update_fan_speed()
-                self.set_state(MyState.ON if fan_on else MyState.OFF)
-
-            case (MyState.ON_MANUAL, MyEvent.TIMER):
-                fan_on = await update_fan_speed()
-                self.set_state(MyState.ON if fan_on else MyState.OFF)
+            # the service layer mutates and retains the dict it is given
+            # (it lands in the call_service event), so pass a fresh one
+            await self.async_service_call(
+                Platform.FAN,
+                SERVICE_SET_PERCENTAGE,
+                {ATTR_PERCENTAGE: new_speed},
+            )
 
-            case _:
-                _LOGGER.debug(
-                    "%s; state=%s; ignored '%s' event",
-                    self.name,
-                    self._state,
-                    event,
-                )
+        self._last_applied_speed = new_speed
+        return new_speed > 0
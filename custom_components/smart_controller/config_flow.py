@@ -1,8 +1,9 @@
 """Adds config flow for Light Controller."""
 from __future__ import annotations
 
-from collections.abc import MutableMapping
-from typing import Final
+from collections.abc import Callable, Mapping, MutableMapping
+from functools import lru_cache
+from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import Platform
@@ -24,6 +25,18 @@ ErrorsType = MutableMapping[str, str]
 
 FAN_TYPE: Final = "fan_type"
 
+# unique-id prefixes are fixed strings; format them once at import time
+_UID_PREFIX: Final = f"{DOMAIN}__"
+_OCCUPANCY_UID_PREFIX: Final = f"{DOMAIN}__{ControllerType.OCCUPANCY}__"
+
+# static menu shown by the user step; built once at import time
+_TYPE_MENU_OPTIONS: Final = [
+    ControllerType.CEILING_FAN,
+    ControllerType.EXHAUST_FAN,
+    ControllerType.LIGHT,
+    ControllerType.OCCUPANCY,
+]
+
 
 class SmartControllerConfigFlow(ConfigFlow, domain=DOMAIN):
     """Config flow for Light Controller."""
@@ -33,6 +46,9 @@ class SmartControllerConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._controlled_entity: str | None = None
+        self._controlled_name: str | None = None
+        self._unique_id: str | None = None
+        self._base_entry_data: dict[str, Any] | None = None
         self._placeholders: dict[str, str] = {}
 
     async def async_step_user(
@@ -42,186 +58,131 @@ class SmartControllerConfigFlow(ConfigFlow, domain=DOMAIN):
         """Handle a flow initialized by the user."""
         return self.async_show_menu(
             step_id="type_menu",
-            menu_options=[
-                ControllerType.CEILING_FAN,
-                ControllerType.EXHAUST_FAN,
-                ControllerType.LIGHT,
-                ControllerType.OCCUPANCY,
-            ],
+            menu_options=_TYPE_MENU_OPTIONS,
         )
 
+    # per-type step spec: controller type, controlled domain, options schema
+    # builder and whether that builder takes the controlled entity
+    _STEP_SPEC: dict[str, tuple[ControllerType, Platform, Callable[..., Any], bool]] = {
+        "ceiling_fan": (
+            ControllerType.CEILING_FAN,
+            Platform.FAN,
+            make_ceiling_fan_schema,
+            True,
+        ),
+        "exhaust_fan": (
+            ControllerType.EXHAUST_FAN,
+            Platform.FAN,
+            make_exhaust_fan_schema,
+            False,
+        ),
+        "light": (
+            ControllerType.LIGHT,
+            Platform.LIGHT,
+            make_light_schema,
+            True,
+        ),
+    }
+
     async def async_step_ceiling_fan(
         self,
         user_input: ConfigType | None = None,
     ) -> FlowResult:
         """Handle a flow initialized by the user."""
-        errors: ErrorsType = {}
-
-        if user_input is not None:
-            self._controlled_entity = user_input[Config.CONTROLLED_ENTITY]
-
-            state = self.hass.states.get(self._controlled_entity)
-            assert state
-            self._placeholders["controlled_entity"] = state.name
-
-            return await self.async_step_ceiling_fan_options()
-
-        return self.async_show_form(
-            step_id="ceiling_fan",
-            data_schema=make_controlled_entity_schema(
-                self.hass, user_input or {}, Platform.FAN
-            ),
-            errors=errors,
-        )
+        return await self._async_select_entity_step("ceiling_fan", user_input)
 
     async def async_step_ceiling_fan_options(
         self,
         user_input: ConfigType | None = None,
     ) -> FlowResult:
         """Handle a flow initialized by the user."""
-        errors: ErrorsType = {}
-
-        assert self._controlled_entity
-
-        if user_input is not None:
-            # TODO: validate dependencies between fields here (or in schema)
-
-            unique_id = f"{DOMAIN}__" + slugify(self._controlled_entity)
-            await self.async_set_unique_id(unique_id)
-            self._abort_if_unique_id_configured()
-
-            state = self.hass.states.get(self._controlled_entity)
-            assert state
-
-            data = {
-                Config.CONTROLLER_TYPE: ControllerType.CEILING_FAN,
-                Config.CONTROLLED_ENTITY: self._controlled_entity,
-                **user_input,
-            }
-
-            return self.async_create_entry(title=state.name, data=data)
-
-        return self.async_show_form(
-            step_id="ceiling_fan_options",
-            data_schema=make_ceiling_fan_schema(
-                self.hass, user_input or {}, self._controlled_entity
-            ),
-            description_placeholders=self._placeholders,
-            errors=errors,
-        )
+        return await self._async_options_step("ceiling_fan", user_input)
 
     async def async_step_exhaust_fan(
         self,
         user_input: ConfigType | None = None,
     ) -> FlowResult:
         """Handle a flow initialized by the user."""
-        errors: ErrorsType = {}
-
-        if user_input is not None:
-            self._controlled_entity = user_input[Config.CONTROLLED_ENTITY]
-
-            state = self.hass.states.get(self._controlled_entity)
-            assert state
-            self._placeholders["controlled_entity"] = state.name
-
-            return await self.async_step_exhaust_fan_options()
-
-        return self.async_show_form(
-            step_id="exhaust_fan",
-            data_schema=make_controlled_entity_schema(
-                self.hass, user_input or {}, Platform.FAN
-            ),
-            errors=errors,
-        )
+        return await self._async_select_entity_step("exhaust_fan", user_input)
 
     async def async_step_exhaust_fan_options(
         self,
         user_input: ConfigType | None = None,
     ) -> FlowResult:
         """Handle a flow initialized by the user."""
-        errors: ErrorsType = {}
-
-        assert self._controlled_entity
-
-        if user_input is not None:
-            unique_id = f"{DOMAIN}__" + slugify(self._controlled_entity)
-            await self.async_set_unique_id(unique_id)
-            self._abort_if_unique_id_configured()
-
-            state = self.hass.states.get(self._controlled_entity)
-            assert state
-
-            data = {
-                Config.CONTROLLER_TYPE: ControllerType.EXHAUST_FAN,
-                Config.CONTROLLED_ENTITY: self._controlled_entity,
-                **user_input,
-            }
-
-            return self.async_create_entry(title=state.name, data=data)
-
-        return self.async_show_form(
-            step_id="exhaust_fan_options",
-            data_schema=make_exhaust_fan_schema(self.hass, user_input or {}),
-            description_placeholders=self._placeholders,
-            errors=errors,
-        )
+        return await self._async_options_step("exhaust_fan", user_input)
 
     async def async_step_light(
         self,
         user_input: ConfigType | None = None,
     ) -> FlowResult:
         """Handle a flow initialized by the user."""
-        errors: ErrorsType = {}
+        return await self._async_select_entity_step("light", user_input)
 
+    async def async_step_light_options(
+        self,
+        user_input: ConfigType | None = None,
+    ) -> FlowResult:
+        """Handle a flow initialized by the user."""
+        return await self._async_options_step("light", user_input)
+
+    async def _async_select_entity_step(
+        self, step_id: str, user_input: ConfigType | None
+    ) -> FlowResult:
+        """Pick the entity to control, then advance to the options step."""
         if user_input is not None:
             self._controlled_entity = user_input[Config.CONTROLLED_ENTITY]
+            self._unique_id = _UID_PREFIX + _slug(self._controlled_entity)
+            await self.async_set_unique_id(self._unique_id)
+            self._abort_if_unique_id_configured()
 
             state = self.hass.states.get(self._controlled_entity)
             assert state
+            self._controlled_name = state.name
             self._placeholders["controlled_entity"] = state.name
 
-            return await self.async_step_light_options()
+            # fixed part of the entry data; submissions only merge options
+            self._base_entry_data = {
+                Config.CONTROLLER_TYPE: self._STEP_SPEC[step_id][0],
+                Config.CONTROLLED_ENTITY: self._controlled_entity,
+            }
+
+            return await self._async_options_step(step_id, None)
+
+        domain = self._STEP_SPEC[step_id][1]
 
         return self.async_show_form(
-            step_id="light",
+            step_id=step_id,
             data_schema=make_controlled_entity_schema(
-                self.hass, user_input or {}, Platform.LIGHT
+                self.hass, user_input or {}, domain
             ),
-            errors=errors,
         )
 
-    async def async_step_light_options(
-        self,
-        user_input: ConfigType | None = None,
+    async def _async_options_step(
+        self, step_id: str, user_input: ConfigType | None
     ) -> FlowResult:
-        """Handle a flow initialized by the user."""
-        errors: ErrorsType = {}
+        """Collect per-type options and create the entry."""
+        schema_builder, takes_entity = self._STEP_SPEC[step_id][2:]
 
         assert self._controlled_entity
 
         if user_input:
-            unique_id = f"{DOMAIN}__" + slugify(self._controlled_entity)
-            await self.async_set_unique_id(unique_id)
-            self._abort_if_unique_id_configured()
+            assert self._controlled_name and self._base_entry_data
 
-            state = self.hass.states.get(self._controlled_entity)
-            assert state
+            data = self._base_entry_data | user_input
 
-            data = {
-                Config.CONTROLLER_TYPE: ControllerType.LIGHT,
-                Config.CONTROLLED_ENTITY: self._controlled_entity,
-                **user_input,
-            }
+            return self.async_create_entry(title=self._controlled_name, data=data)
 
-            return self.async_create_entry(title=state.name, data=data)
+        schema = (
+            schema_builder(self.hass, user_input or {}, self._controlled_entity)
+            if takes_entity
+            else schema_builder(self.hass, user_input or {})
+        )
 
         return self.async_show_form(
-            step_id="light_options",
-            data_schema=make_light_schema(
-                self.hass, user_input or {}, self._controlled_entity
-            ),
+            step_id=f"{step_id}_options",
+            data_schema=schema,
             description_placeholders=self._placeholders,
-            errors=errors,
         )
 
     async def async_step_occupancy(
@@ -229,23 +190,26 @@ class SmartControllerConfigFlow(ConfigFlow, domain=DOMAIN):
         user_input: ConfigType | None = None,
     ) -> FlowResult:
         """Handle a flow initialized by the user."""
-        errors: ErrorsType = {}
-
-        if user_input is not None and _validate_occupancy(user_input, errors):
-            sensor_name = user_input[Config.SENSOR_NAME]
-            unique_id = f"{DOMAIN}__{ControllerType.OCCUPANCY}__" + slugify(sensor_name)
+        errors: ErrorsType | None = None
 
-            if await self.async_set_unique_id(unique_id):
-                errors["base"] = "duplicate_name"
+        if user_input is not None:
+            if (error := _validate_occupancy(user_input)) is not None:
+                errors = {"base": error}
             else:
-                self._abort_if_unique_id_configured()
+                sensor_name = user_input[Config.SENSOR_NAME]
+                unique_id = _OCCUPANCY_UID_PREFIX + _slug(sensor_name)
+
+                if await self.async_set_unique_id(unique_id):
+                    errors = {"base": "duplicate_name"}
+                else:
+                    self._abort_if_unique_id_configured()
 
-                data = {
-                    Config.CONTROLLER_TYPE: ControllerType.OCCUPANCY,
-                    **user_input,
-                }
+                    data = {
+                        Config.CONTROLLER_TYPE: ControllerType.OCCUPANCY,
+                        **user_input,
+                    }
 
-                return self.async_create_entry(title=sensor_name, data=data)
+                    return self.async_create_entry(title=sensor_name, data=data)
 
         return self.async_show_form(
             step_id="occupancy",
@@ -265,10 +229,14 @@ class SmartControllerOptionsFlow(OptionsFlow):  # type: ignore
 
     def __init__(self, config_entry: ConfigEntry):
         """Initialize options flow."""
-        data = dict(config_entry.data)
-        self._controller_type = data.pop(Config.CONTROLLER_TYPE)
-        self._controlled_entity = data.pop(Config.CONTROLLED_ENTITY, None)
-        self.original_data = dict(config_entry.options) or data
+        entry_data = config_entry.data
+        self._controller_type = entry_data[Config.CONTROLLER_TYPE]
+        self._controlled_entity = entry_data.get(Config.CONTROLLED_ENTITY)
+        # both mappings are read-only proxies and the schema builders only
+        # read from them, so neither needs to be copied; the type and
+        # entity keys left in the fallback are simply never looked up
+        self.original_data: Mapping[str, Any] = config_entry.options or entry_data
+        self._controlled_name: str | None = None
         self._placeholders: dict[str, str] = {}
 
     async def async_step_init(self, _: ConfigType | None = None) -> FlowResult:
@@ -276,98 +244,73 @@ class SmartControllerOptionsFlow(OptionsFlow):  # type: ignore
         if self._controlled_entity:
             state = self.hass.states.get(self._controlled_entity)
             assert state
+            self._controlled_name = state.name
             self._placeholders["controlled_entity"] = state.name
 
-        match self._controller_type:
-            case ControllerType.CEILING_FAN:
-                return await self.async_step_ceiling_fan()
-            case ControllerType.EXHAUST_FAN:
-                return await self.async_step_exhaust_fan()
-            case ControllerType.LIGHT:
-                return await self.async_step_light()
-            case ControllerType.OCCUPANCY:
-                return await self.async_step_occupancy()
+        if (handler := self._INIT_DISPATCH.get(self._controller_type)) is not None:
+            return await handler(self)
         raise AbortFlow("invalid_type")
 
+    # schema builder per step and whether it takes the controlled entity;
+    # the steps themselves are otherwise identical
+    _STEP_SCHEMAS: dict[str, tuple[Callable[..., Any], bool]] = {
+        "ceiling_fan": (make_ceiling_fan_schema, True),
+        "exhaust_fan": (make_exhaust_fan_schema, False),
+        "light": (make_light_schema, True),
+    }
+
     async def async_step_ceiling_fan(
         self, user_input: ConfigType | None = None
     ) -> FlowResult:
         """Handle option flow 'ceiling fan' step."""
-        errors: ErrorsType = {}
-
-        assert self._controlled_entity
-
-        if user_input is not None:
-            state = self.hass.states.get(self._controlled_entity)
-            assert state
-            return self.async_create_entry(title=state.name, data=user_input)
-
-        schema = make_ceiling_fan_schema(
-            self.hass, user_input or self.original_data, self._controlled_entity
-        )
-
-        return self.async_show_form(
-            step_id="ceiling_fan",
-            data_schema=schema,
-            description_placeholders=self._placeholders,
-            errors=errors,
-        )
+        return await self._async_common_step("ceiling_fan", user_input)
 
     async def async_step_exhaust_fan(
         self, user_input: ConfigType | None = None
     ) -> FlowResult:
         """Handle option flow 'exhaust fan' step."""
-        errors: ErrorsType = {}
-
-        assert self._controlled_entity
-
-        if user_input is not None:
-            state = self.hass.states.get(self._controlled_entity)
-            assert state
-            return self.async_create_entry(title=state.name, data=user_input)
-
-        schema = make_exhaust_fan_schema(self.hass, user_input or self.original_data)
-
-        return self.async_show_form(
-            step_id="exhaust_fan",
-            data_schema=schema,
-            description_placeholders=self._placeholders,
-            errors=errors,
-        )
+        return await self._async_common_step("exhaust_fan", user_input)
 
     async def async_step_light(
         self, user_input: ConfigType | None = None
     ) -> FlowResult:
         """Handle option flow 'light' step."""
-        errors: ErrorsType = {}
+        return await self._async_common_step("light", user_input)
 
+    async def _async_common_step(
+        self, step_id: str, user_input: ConfigType | None
+    ) -> FlowResult:
+        """Handle the options step shared by all entity-controlling types."""
         assert self._controlled_entity
 
         if user_input:
-            state = self.hass.states.get(self._controlled_entity)
-            assert state
-            return self.async_create_entry(title=state.name, data=user_input)
-
-        schema = make_light_schema(
-            self.hass, user_input or self.original_data, self._controlled_entity
+            assert self._controlled_name
+            return self.async_create_entry(title=self._controlled_name, data=user_input)
+
+        schema_builder, takes_entity = self._STEP_SCHEMAS[step_id]
+        schema = (
+            schema_builder(self.hass, self.original_data, self._controlled_entity)
+            if takes_entity
+            else schema_builder(self.hass, self.original_data)
         )
 
         return self.async_show_form(
-            step_id="light",
+            step_id=step_id,
             data_schema=schema,
             description_placeholders=self._placeholders,
-            errors=errors,
         )
 
     async def async_step_occupancy(
         self, user_input: ConfigType | None = None
     ) -> FlowResult:
         """Handle option flow 'occupancy' step."""
-        errors: ErrorsType = {}
+        errors: ErrorsType | None = None
 
-        if user_input is not None and _validate_occupancy(user_input, errors):
-            sensor_name = user_input[Config.SENSOR_NAME]
-            return self.async_create_entry(title=sensor_name, data=user_input)
+        if user_input is not None:
+            if (error := _validate_occupancy(user_input)) is None:
+                sensor_name = user_input[Config.SENSOR_NAME]
+                return self.async_create_entry(title=sensor_name, data=user_input)
+            errors = {"base": error}
 
         schema = make_occupancy_schema(self.hass, user_input or self.original_data)
 
@@ -377,26 +320,39 @@ class SmartControllerOptionsFlow(OptionsFlow):  # type: ignore
             errors=errors,
         )
 
+    # O(1) init-step dispatch on controller type; defined after the step
+    # methods so the table can reference them directly
+    _INIT_DISPATCH = {
+        ControllerType.CEILING_FAN: async_step_ceiling_fan,
+        ControllerType.EXHAUST_FAN: async_step_exhaust_fan,
+        ControllerType.LIGHT: async_step_light,
+        ControllerType.OCCUPANCY: async_step_occupancy,
+    }
+
 
 # #### Internal functions ####
 
 
-def _validate_occupancy(user_input: ConfigType, errors: ErrorsType) -> bool:
+@lru_cache(maxsize=64)
+def _slug(value: str) -> str:
+    """Slugify with memoization; retries and re-renders repeat the same names."""
+    return slugify(value)
+
+
+def _validate_occupancy(user_input: ConfigType) -> str | None:
+    """Validate occupancy input, returning an error key or 'None' if valid."""
     motion_sensors = user_input.get(Config.MOTION_SENSORS)
     off_minutes = user_input.get(Config.MOTION_OFF_MINUTES)
     door_sensors = user_input.get(Config.DOOR_SENSORS)
     other_entities = user_input.get(Config.OTHER_ENTITIES)
 
     if not motion_sensors and not other_entities:
-        errors["base"] = "occupancy_needs_trigger"
-        return False
+        return "occupancy_needs_trigger"
 
     if motion_sensors and not off_minutes:
-        errors["base"] = "motion_needs_minutes"
-        return False
+        return "motion_needs_minutes"
 
     if door_sensors and not motion_sensors:
-        errors["base"] = "door_needs_motion"
-        return False
+        return "door_needs_motion"
 
-    return True
+    return None
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from collections.abc import MutableMapping
-from typing import Final
+from functools import lru_cache
+from typing import Any, Final
 
 import voluptuous as vol
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -10,10 +11,19 @@ from homeassistant.components.fan import ATTR_PERCENTAGE_STEP
 from homeassistant.components.input_boolean import DOMAIN as INPUT_BOOLEAN_DOMAIN
 from homeassistant.components.light import ATTR_SUPPORTED_COLOR_MODES, ColorMode
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    PERCENTAGE,
+    Platform,
+    UnitOfTemperature,
+)
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import AbortFlow
-from homeassistant.helpers import selector
+from homeassistant.helpers import entity_registry, selector
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.unit_conversion import TemperatureConverter
 
@@ -25,23 +35,240 @@ from .const import (
     DEFAULT_EXHAUST_RISING_THRESHOLD,
     DOMAIN,
     GRAMS_PER_CUBIC_METER,
+    ON_OFF_STATES,
     Config,
 )
-from .util import domain_entities, on_off_entities
 
 ErrorsType = MutableMapping[str, str]
 
 FAN_TYPE: Final = "fan_type"
 
+_FLOW_CACHE: Final = f"{DOMAIN}_flow_cache"
+
+# selectors are stateless validators, so single shared instances can appear
+# in any number of schemas
+_MINUTES_SELECTOR: Final = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=60,
+        unit_of_measurement="minutes",
+        mode=selector.NumberSelectorMode.SLIDER,
+    ),
+)
+
+_ILLUMINANCE_SELECTOR: Final = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        mode=selector.NumberSelectorMode.BOX,
+    ),
+)
+
+# the int-coercing composites are equally stateless; compose them once
+# instead of rebuilding the vol.All chain on every form render
+_MINUTES_INT: Final = vol.All(_MINUTES_SELECTOR, vol.Coerce(int))
+
+_ILLUMINANCE_INT: Final = vol.All(_ILLUMINANCE_SELECTOR, vol.Coerce(int))
+
+_ABS_HUMIDITY_SELECTOR: Final = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.0,
+        max=5.0,
+        step=0.1,
+        unit_of_measurement=GRAMS_PER_CUBIC_METER,
+        mode=selector.NumberSelectorMode.SLIDER,
+    ),
+)
+
+
+def _flow_cache(hass: HomeAssistant) -> dict[Any, Any]:
+    """Return the per-instance schema cache, creating it on first use.
+
+    Entity scans are expensive and re-run on every form render; cache the
+    results and drop them whenever the entity registry changes.
+    """
+    cache: dict[Any, Any] | None = hass.data.get(_FLOW_CACHE)
+    if cache is None:
+        cache = hass.data[_FLOW_CACHE] = {}
+
+        @callback
+        def _invalidate(_: Event) -> None:
+            cache.clear()
+
+        hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, _invalidate)
+
+        @callback
+        def _entries_changed(*_: Any) -> None:
+            # fires for every config entry, and a reloaded integration can
+            # re-add its entities without any registry event — drop the
+            # whole cache, not just the controlled-entities set
+            cache.clear()
+
+        async_dispatcher_connect(hass, SIGNAL_CONFIG_ENTRY_CHANGED, _entries_changed)
+    return cache
+
+
+@lru_cache(maxsize=4)
+def _default_ssi_bounds(unit: str) -> tuple[float, float]:
+    """Return the default SSI range converted to the given temperature unit."""
+    return (
+        round(
+            TemperatureConverter.convert(
+                DEFAULT_CEILING_SSI_MIN_FAHRENHEIT, UnitOfTemperature.FAHRENHEIT, unit
+            ),
+            1,
+        ),
+        round(
+            TemperatureConverter.convert(
+                DEFAULT_CEILING_SSI_MAX_FAHRENHEIT, UnitOfTemperature.FAHRENHEIT, unit
+            ),
+            1,
+        ),
+    )
+
+
+@lru_cache(maxsize=4)
+def _ssi_selector(unit: str) -> selector.NumberSelector:
+    """Return the SSI number selector for the given temperature unit."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            unit_of_measurement=unit,
+            mode=selector.NumberSelectorMode.BOX,
+        ),
+    )
+
+
+_TEMPERATURE_UNITS: Final = (
+    None,
+    UnitOfTemperature.CELSIUS,
+    UnitOfTemperature.FAHRENHEIT,
+)
+_HUMIDITY_UNITS: Final = (None, PERCENTAGE)
+
+
+def _entity_catalog(hass: HomeAssistant) -> dict[str, frozenset[str]]:
+    """Bucket every entity the schema builders need in one pass.
+
+    All builders index into the same catalog, so a full flow costs a
+    single walk of the state machine no matter how many steps and
+    re-renders it goes through.
+    """
+    cache = _flow_cache(hass)
+    if (catalog := cache.get("catalog")) is not None:
+        return catalog
+
+    ent_reg = entity_registry.async_get(hass)
+
+    fans: set[str] = set()
+    lights: set[str] = set()
+    temperature: set[str] = set()
+    humidity: set[str] = set()
+    illuminance: set[str] = set()
+    binary_like: set[str] = set()
+    motion: set[str] = set()
+    door: set[str] = set()
+
+    for state in hass.states.async_all():
+        entity_id = state.entity_id
+        entity = ent_reg.async_get(entity_id)
+        if entity is not None and entity.hidden:
+            continue
+
+        domain = state.domain
+        attributes = state.attributes
+
+        if domain == Platform.FAN:
+            fans.add(entity_id)
+        elif domain == Platform.LIGHT:
+            lights.add(entity_id)
+        elif domain == Platform.SENSOR:
+            device_class = attributes.get(ATTR_DEVICE_CLASS)
+            if device_class == SensorDeviceClass.TEMPERATURE:
+                if attributes.get(ATTR_UNIT_OF_MEASUREMENT) in _TEMPERATURE_UNITS:
+                    temperature.add(entity_id)
+            elif device_class == SensorDeviceClass.HUMIDITY:
+                if attributes.get(ATTR_UNIT_OF_MEASUREMENT) in _HUMIDITY_UNITS:
+                    humidity.add(entity_id)
+            elif device_class == SensorDeviceClass.ILLUMINANCE:
+                illuminance.add(entity_id)
+        elif domain == Platform.BINARY_SENSOR:
+            binary_like.add(entity_id)
+            device_class = attributes.get(ATTR_DEVICE_CLASS)
+            if device_class == BinarySensorDeviceClass.MOTION:
+                motion.add(entity_id)
+            elif device_class in (
+                BinarySensorDeviceClass.DOOR,
+                BinarySensorDeviceClass.GARAGE_DOOR,
+            ):
+                door.add(entity_id)
+        elif domain == INPUT_BOOLEAN_DOMAIN:
+            binary_like.add(entity_id)
+
+    catalog = {
+        "fan": frozenset(fans),
+        "light": frozenset(lights),
+        "temperature": frozenset(temperature),
+        "humidity": frozenset(humidity),
+        "illuminance": frozenset(illuminance),
+        "binary_like": frozenset(binary_like),
+        "motion": frozenset(motion),
+        "door": frozenset(door),
+    }
+
+    # before startup completes the state machine may be missing entities
+    # that will never fire a registry event when they come back, so a
+    # snapshot taken now would stay incomplete for the life of the cache
+    if hass.state == CoreState.running:
+        cache["catalog"] = catalog
+
+    return catalog
+
+
+def _on_off_entities(hass: HomeAssistant) -> tuple[frozenset[str], frozenset[str]]:
+    """Return entities currently in an on/off state, in one pass.
+
+    These buckets depend on live state, not the registry, so they are
+    recomputed per render; an entity that comes back from unavailable
+    must show up in the pickers immediately.
+    """
+    ent_reg = entity_registry.async_get(hass)
+    no_fan: set[str] = set()
+    no_binary: set[str] = set()
+
+    for state in hass.states.async_all():
+        if state.state not in ON_OFF_STATES:
+            continue
+        entity_id = state.entity_id
+        entity = ent_reg.async_get(entity_id)
+        if entity is not None and entity.hidden:
+            continue
+        domain = state.domain
+        if domain != Platform.FAN:
+            no_fan.add(entity_id)
+        if domain != Platform.BINARY_SENSOR and domain != INPUT_BOOLEAN_DOMAIN:
+            no_binary.add(entity_id)
+
+    return frozenset(no_fan), frozenset(no_binary)
+
+
+@lru_cache(maxsize=32)
+def _sorted_unique(entities: frozenset[str]) -> tuple[str, ...]:
+    """Return the entity set as a sorted tuple, cached by value."""
+    return tuple(sorted(entities))
+
+
+def _required_entities(hass: HomeAssistant) -> frozenset[str]:
+    """Return binary-like entities usable as required on/off conditions."""
+    return _entity_catalog(hass)["binary_like"] | _on_off_entities(hass)[0]
+
 
 def make_controlled_entity_schema(
     hass: HomeAssistant, user_input: ConfigType, domain: str
 ) -> vol.Schema:
     """Create 'controlled_entity' config schema."""
 
-    entities = domain_entities(hass, domain)
-    entities.difference_update(_existing_controlled_entities(hass))
-    entities = sorted(entities)
+    entities = _sorted_unique(
+        _entity_catalog(hass)[domain].difference(_existing_controlled_entities(hass))
+    )
 
     if not entities:
         raise AbortFlow("nothing_to_control")
@@ -49,10 +276,10 @@ def make_controlled_entity_schema(
     return vol.Schema(
         {
             vol.Required(
-                str(Config.CONTROLLED_ENTITY),
+                Config.CONTROLLED_ENTITY,
                 default=user_input.get(Config.CONTROLLED_ENTITY, vol.UNDEFINED),
             ): selector.EntitySelector(
-                selector.EntitySelectorConfig(include_entities=entities),
+                selector.EntitySelectorConfig(include_entities=list(entities)),
             ),
         }
     )
@@ -63,51 +290,31 @@ def make_ceiling_fan_schema(
 ) -> vol.Schema:
     """Create 'ceiling_fan' config schema."""
 
-    temp_sensors = domain_entities(
-        hass,
-        [Platform.SENSOR],
-        device_classes=SensorDeviceClass.TEMPERATURE,
-        units_of_measurement=[
-            None,
-            UnitOfTemperature.CELSIUS,
-            UnitOfTemperature.FAHRENHEIT,
-        ],
-    )
-
-    humidity_sensors = domain_entities(
-        hass,
-        [Platform.SENSOR],
-        device_classes=SensorDeviceClass.HUMIDITY,
-        units_of_measurement=[None, PERCENTAGE],
-    )
-
-    required_entities = domain_entities(
-        hass, [Platform.BINARY_SENSOR, INPUT_BOOLEAN_DOMAIN]
-    ) | on_off_entities(hass, [Platform.FAN])
-
     fan_state = hass.states.get(controlled_entity)
     assert fan_state
     speed_step = fan_state.attributes.get(ATTR_PERCENTAGE_STEP, 100)
+    temp_unit = hass.config.units.temperature_unit
 
-    default_ssi_min = TemperatureConverter.convert(
-        DEFAULT_CEILING_SSI_MIN_FAHRENHEIT,
-        UnitOfTemperature.FAHRENHEIT,
-        hass.config.units.temperature_unit,
+    catalog = _entity_catalog(hass)
+    temp_selector = selector.EntitySelector(
+        selector.EntitySelectorConfig(include_entities=list(catalog["temperature"])),
     )
-
-    default_ssi_max = TemperatureConverter.convert(
-        DEFAULT_CEILING_SSI_MAX_FAHRENHEIT,
-        UnitOfTemperature.FAHRENHEIT,
-        hass.config.units.temperature_unit,
+    humidity_selector = selector.EntitySelector(
+        selector.EntitySelectorConfig(include_entities=list(catalog["humidity"])),
     )
 
-    ssi_selector = selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            unit_of_measurement=hass.config.units.temperature_unit,
-            mode=selector.NumberSelectorMode.BOX,
+    required_entities = _sorted_unique(_required_entities(hass))
+    # both required-entity fields validate against the same list; one
+    # selector instance serves them both
+    required_selector = selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            include_entities=list(required_entities), multiple=True
         ),
     )
 
+    default_ssi_min, default_ssi_max = _default_ssi_bounds(temp_unit)
+    ssi_selector = _ssi_selector(temp_unit)
+
     speed_selector = selector.NumberSelector(
         selector.NumberSelectorConfig(
             min=0,
@@ -118,77 +325,56 @@ def make_ceiling_fan_schema(
         ),
     )
 
-    minutes_selector = selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            min=0,
-            max=60,
-            unit_of_measurement="minutes",
-            mode=selector.NumberSelectorMode.SLIDER,
-        ),
-    )
-
     return vol.Schema(
         {
             # temperature sensor
             vol.Required(
-                str(Config.TEMP_SENSOR),
+                Config.TEMP_SENSOR,
                 default=user_input.get(Config.TEMP_SENSOR, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(include_entities=list(temp_sensors)),
-            ),
+            ): temp_selector,
             # humidity sensor
             vol.Required(
-                str(Config.HUMIDITY_SENSOR),
+                Config.HUMIDITY_SENSOR,
                 default=user_input.get(Config.HUMIDITY_SENSOR, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(include_entities=list(humidity_sensors)),
-            ),
+            ): humidity_selector,
             # minimum SSI
             vol.Required(
-                str(Config.SSI_MIN),
-                default=user_input.get(Config.SSI_MIN, round(default_ssi_min, 1)),
+                Config.SSI_MIN,
+                default=user_input.get(Config.SSI_MIN, default_ssi_min),
             ): ssi_selector,
             # maximum SSI
             vol.Required(
-                str(Config.SSI_MAX),
-                default=user_input.get(Config.SSI_MAX, round(default_ssi_max, 1)),
+                Config.SSI_MAX,
+                default=user_input.get(Config.SSI_MAX, default_ssi_max),
             ): ssi_selector,
             # minimum fan speed
             vol.Required(
-                str(Config.SPEED_MIN),
+                Config.SPEED_MIN,
                 default=user_input.get(Config.SPEED_MIN, vol.UNDEFINED),
             ): speed_selector,
             # maximum fan speed
             vol.Required(
-                str(Config.SPEED_MAX),
+                Config.SPEED_MAX,
                 default=user_input.get(Config.SPEED_MAX, vol.UNDEFINED),
             ): speed_selector,
             # required on entities
             vol.Optional(
-                str(Config.REQUIRED_ON_ENTITIES),
+                Config.REQUIRED_ON_ENTITIES,
                 default=user_input.get(Config.REQUIRED_ON_ENTITIES, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    include_entities=list(required_entities), multiple=True
-                ),
-            ),
+            ): required_selector,
             # required off entities
             vol.Optional(
-                str(Config.REQUIRED_OFF_ENTITIES),
+                Config.REQUIRED_OFF_ENTITIES,
                 default=user_input.get(Config.REQUIRED_OFF_ENTITIES, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    include_entities=list(required_entities), multiple=True
-                ),
-            ),
+            ): required_selector,
             # manual control minutes (optional)
             vol.Optional(
-                str(Config.MANUAL_CONTROL_MINUTES),
+                Config.MANUAL_CONTROL_MINUTES,
                 default=user_input.get(
                     Config.MANUAL_CONTROL_MINUTES,
                     vol.UNDEFINED,
                 ),
-            ): vol.All(minutes_selector, vol.Coerce(int)),
+            ): _MINUTES_INT,
         }
     )
 
@@ -196,96 +382,61 @@ def make_ceiling_fan_schema(
 def make_exhaust_fan_schema(hass: HomeAssistant, user_input: ConfigType) -> vol.Schema:
     """Create 'exhaust_fan' config schema."""
 
-    temp_sensors = domain_entities(
-        hass,
-        [Platform.SENSOR],
-        device_classes=SensorDeviceClass.TEMPERATURE,
-        units_of_measurement=[
-            None,
-            UnitOfTemperature.CELSIUS,
-            UnitOfTemperature.FAHRENHEIT,
-        ],
-    )
-
-    humidity_sensors = domain_entities(
-        hass,
-        [Platform.SENSOR],
-        device_classes=SensorDeviceClass.HUMIDITY,
-        units_of_measurement=[None, PERCENTAGE],
-    )
-
-    abs_humidity_selector = selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            min=0.0,
-            max=5.0,
-            step=0.1,
-            unit_of_measurement=GRAMS_PER_CUBIC_METER,
-            mode=selector.NumberSelectorMode.SLIDER,
-        ),
+    catalog = _entity_catalog(hass)
+    # the reference fields validate against the same lists as the primary
+    # ones, so each selector is built once and used twice
+    temp_selector = selector.EntitySelector(
+        selector.EntitySelectorConfig(include_entities=list(catalog["temperature"])),
     )
-
-    minutes_selector = selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            min=0,
-            max=60,
-            unit_of_measurement="minutes",
-            mode=selector.NumberSelectorMode.SLIDER,
-        ),
+    humidity_selector = selector.EntitySelector(
+        selector.EntitySelectorConfig(include_entities=list(catalog["humidity"])),
     )
 
     return vol.Schema(
         {
             # temperature sensor
             vol.Required(
-                str(Config.TEMP_SENSOR),
+                Config.TEMP_SENSOR,
                 default=user_input.get(Config.TEMP_SENSOR, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(include_entities=list(temp_sensors)),
-            ),
+            ): temp_selector,
             # humidity sensor
             vol.Required(
-                str(Config.HUMIDITY_SENSOR),
+                Config.HUMIDITY_SENSOR,
                 default=user_input.get(Config.HUMIDITY_SENSOR, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(include_entities=list(humidity_sensors)),
-            ),
+            ): humidity_selector,
             # reference temperature sensor
             vol.Required(
-                str(Config.REFERENCE_TEMP_SENSOR),
+                Config.REFERENCE_TEMP_SENSOR,
                 default=user_input.get(Config.REFERENCE_TEMP_SENSOR, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(include_entities=list(temp_sensors)),
-            ),
+            ): temp_selector,
             # reference humidity sensor
             vol.Required(
-                str(Config.REFERENCE_HUMIDITY_SENSOR),
+                Config.REFERENCE_HUMIDITY_SENSOR,
                 default=user_input.get(Config.REFERENCE_HUMIDITY_SENSOR, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(include_entities=list(humidity_sensors)),
-            ),
+            ): humidity_selector,
             # rising threshold
             vol.Required(
-                str(Config.RISING_THRESHOLD),
+                Config.RISING_THRESHOLD,
                 default=user_input.get(
                     Config.RISING_THRESHOLD, DEFAULT_EXHAUST_RISING_THRESHOLD
                 ),
-            ): abs_humidity_selector,
+            ): _ABS_HUMIDITY_SELECTOR,
             # falling threshold
             vol.Required(
-                str(Config.FALLING_THRESHOLD),
+                Config.FALLING_THRESHOLD,
                 default=user_input.get(
                     Config.FALLING_THRESHOLD,
                     DEFAULT_EXHAUST_FALLING_THRESHOLD,
                 ),
-            ): abs_humidity_selector,
+            ): _ABS_HUMIDITY_SELECTOR,
             # manual control minutes
             vol.Optional(
-                str(Config.MANUAL_CONTROL_MINUTES),
+                Config.MANUAL_CONTROL_MINUTES,
                 default=user_input.get(
                     Config.MANUAL_CONTROL_MINUTES,
                     DEFAULT_EXHAUST_MANUAL_MINUTES,
                 ),
-            ): vol.All(minutes_selector, vol.Coerce(int)),
+            ): _MINUTES_INT,
         }
     )
 
@@ -295,39 +446,24 @@ def make_light_schema(
 ) -> vol.Schema:
     """Create 'light' config schema."""
 
-    illuminance_sensors = domain_entities(
-        hass,
-        [Platform.SENSOR],
-        device_classes=SensorDeviceClass.ILLUMINANCE,
-    )
-
-    binary_entities = domain_entities(
-        hass, [Platform.BINARY_SENSOR, INPUT_BOOLEAN_DOMAIN]
-    )
-
-    minutes_selector = selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            min=0,
-            max=60,
-            unit_of_measurement="minutes",
-            mode=selector.NumberSelectorMode.SLIDER,
-        ),
-    )
-
-    illuminance_selector = selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            min=0,
-            mode=selector.NumberSelectorMode.BOX,
+    light_state = hass.states.get(controlled_entity)
+    assert light_state
+    color_modes = light_state.attributes.get(ATTR_SUPPORTED_COLOR_MODES, [])
+    has_brightness = ColorMode.BRIGHTNESS in color_modes
+
+    catalog = _entity_catalog(hass)
+    illuminance_sensors = catalog["illuminance"]
+    binary_entities = catalog["binary_like"]
+    # shared by the required on/off fields
+    binary_multi_selector = selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            include_entities=list(binary_entities), multiple=True
         ),
     )
 
     schema = {}
 
-    light_state = hass.states.get(controlled_entity)
-    assert light_state
-    color_modes = light_state.attributes.get(ATTR_SUPPORTED_COLOR_MODES, [])
-
-    if ColorMode.BRIGHTNESS in color_modes:
+    if has_brightness:
         brightness_selector = selector.NumberSelector(
             selector.NumberSelectorConfig(
                 min=1,
@@ -340,7 +476,7 @@ def make_light_schema(
         schema.update(
             {
                 vol.Required(
-                    str(Config.BRIGHTNESS_PCT),
+                    Config.BRIGHTNESS_PCT,
                     default=user_input.get(Config.BRIGHTNESS_PCT, 100),
                 ): brightness_selector,
             }
@@ -350,14 +486,14 @@ def make_light_schema(
         {
             # trigger entities
             vol.Optional(
-                str(Config.TRIGGER_ENTITY),
+                Config.TRIGGER_ENTITY,
                 default=user_input.get(Config.TRIGGER_ENTITY, vol.UNDEFINED),
             ): selector.EntitySelector(
                 selector.EntitySelectorConfig(include_entities=list(binary_entities)),
             ),
             # illuminance sensor
             vol.Inclusive(
-                str(Config.ILLUMINANCE_SENSOR),
+                Config.ILLUMINANCE_SENSOR,
                 "illumininance",
                 default=user_input.get(Config.ILLUMINANCE_SENSOR, vol.UNDEFINED),
             ): selector.EntitySelector(
@@ -367,33 +503,25 @@ def make_light_schema(
             ),
             # illuminance threshold
             vol.Inclusive(
-                str(Config.ILLUMINANCE_CUTOFF),
+                Config.ILLUMINANCE_CUTOFF,
                 "illumininance",
                 default=user_input.get(Config.ILLUMINANCE_CUTOFF, vol.UNDEFINED),
-            ): vol.All(illuminance_selector, vol.Coerce(int)),
+            ): _ILLUMINANCE_INT,
             # required 'on' entities
             vol.Optional(
-                str(Config.REQUIRED_ON_ENTITIES),
+                Config.REQUIRED_ON_ENTITIES,
                 default=user_input.get(Config.REQUIRED_ON_ENTITIES, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    include_entities=list(binary_entities), multiple=True
-                ),
-            ),
+            ): binary_multi_selector,
             # required 'off' entities
             vol.Optional(
-                str(Config.REQUIRED_OFF_ENTITIES),
+                Config.REQUIRED_OFF_ENTITIES,
                 default=user_input.get(Config.REQUIRED_OFF_ENTITIES, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    include_entities=list(binary_entities), multiple=True
-                ),
-            ),
+            ): binary_multi_selector,
             # auto off minutes
             vol.Optional(
-                str(Config.AUTO_OFF_MINUTES),
+                Config.AUTO_OFF_MINUTES,
                 default=user_input.get(Config.AUTO_OFF_MINUTES, vol.UNDEFINED),
-            ): vol.All(minutes_selector, vol.Coerce(int)),
+            ): _MINUTES_INT,
         }
     )
 
@@ -403,46 +531,31 @@ def make_light_schema(
 def make_occupancy_schema(hass: HomeAssistant, user_input: ConfigType) -> vol.Schema:
     """Create 'occupancy' config schema."""
 
-    motion_sensors = domain_entities(
-        hass,
-        [Platform.BINARY_SENSOR],
-        device_classes=BinarySensorDeviceClass.MOTION,
-    )
-
-    minutes_selector = selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            min=0,
-            max=60,
-            unit_of_measurement="minutes",
-            mode=selector.NumberSelectorMode.SLIDER,
-        ),
-    )
-
-    conditional_entities = domain_entities(
-        hass, [Platform.BINARY_SENSOR, INPUT_BOOLEAN_DOMAIN]
-    ) | on_off_entities(hass, [Platform.BINARY_SENSOR, INPUT_BOOLEAN_DOMAIN])
+    catalog = _entity_catalog(hass)
+    motion_sensors = catalog["motion"]
 
-    conditional_entities -= motion_sensors
+    conditional_entities = (
+        catalog["binary_like"] | _on_off_entities(hass)[1]
+    ) - motion_sensors
 
-    door_sensors = domain_entities(
-        hass,
-        [Platform.BINARY_SENSOR],
-        device_classes=[
-            BinarySensorDeviceClass.DOOR,
-            BinarySensorDeviceClass.GARAGE_DOOR,
-        ],
+    door_sensors = catalog["door"]
+    # shared by the other-entities and required on/off fields
+    conditional_selector = selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            include_entities=list(conditional_entities), multiple=True
+        ),
     )
 
     return vol.Schema(
         {
             # name
             vol.Required(
-                str(Config.SENSOR_NAME),
+                Config.SENSOR_NAME,
                 default=user_input.get(Config.SENSOR_NAME, vol.UNDEFINED),
             ): str,
             # motion sensors
             vol.Optional(
-                str(Config.MOTION_SENSORS),
+                Config.MOTION_SENSORS,
                 default=user_input.get(Config.MOTION_SENSORS, vol.UNDEFINED),
             ): selector.EntitySelector(
                 selector.EntitySelectorConfig(
@@ -451,21 +564,17 @@ def make_occupancy_schema(hass: HomeAssistant, user_input: ConfigType) -> vol.Sc
             ),
             # motion-off minutes
             vol.Optional(
-                str(Config.MOTION_OFF_MINUTES),
+                Config.MOTION_OFF_MINUTES,
                 default=user_input.get(Config.MOTION_OFF_MINUTES, vol.UNDEFINED),
-            ): vol.All(minutes_selector, vol.Coerce(int)),
+            ): _MINUTES_INT,
             # other entities
             vol.Optional(
-                str(Config.OTHER_ENTITIES),
+                Config.OTHER_ENTITIES,
                 default=user_input.get(Config.OTHER_ENTITIES, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    include_entities=list(conditional_entities), multiple=True
-                ),
-            ),
+            ): conditional_selector,
             # door sensors
             vol.Optional(
-                str(Config.DOOR_SENSORS),
+                Config.DOOR_SENSORS,
                 default=user_input.get(Config.DOOR_SENSORS, vol.UNDEFINED),
             ): selector.EntitySelector(
                 selector.EntitySelectorConfig(
@@ -474,22 +583,14 @@ def make_occupancy_schema(hass: HomeAssistant, user_input: ConfigType) -> vol.Sc
             ),
             # required on entities
             vol.Optional(
-                str(Config.REQUIRED_ON_ENTITIES),
+                Config.REQUIRED_ON_ENTITIES,
                 default=user_input.get(Config.REQUIRED_ON_ENTITIES, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    include_entities=list(conditional_entities), multiple=True
-                ),
-            ),
+            ): conditional_selector,
             # required off entities
             vol.Optional(
-                str(Config.REQUIRED_OFF_ENTITIES),
+                Config.REQUIRED_OFF_ENTITIES,
                 default=user_input.get(Config.REQUIRED_OFF_ENTITIES, vol.UNDEFINED),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    include_entities=list(conditional_entities), multiple=True
-                ),
-            ),
+            ): conditional_selector,
         }
     )
 
@@ -497,8 +598,14 @@ def make_occupancy_schema(hass: HomeAssistant, user_input: ConfigType) -> vol.Sc
 # #### Internal functions ####
 
 
-def _existing_controlled_entities(hass: HomeAssistant):
-    return [
-        entry.data.get(Config.CONTROLLED_ENTITY)
-        for entry in hass.config_entries.async_entries(DOMAIN)
-    ]
+def _existing_controlled_entities(hass: HomeAssistant) -> frozenset[str]:
+    cache = _flow_cache(hass)
+    if (entities := cache.get("already_controlled")) is None:
+        entities = cache["already_controlled"] = (
+            frozenset(
+                entry.data.get(Config.CONTROLLED_ENTITY)
+                for entry in hass.config_entries.async_entries(DOMAIN)
+            )
+            - {None}
+        )
+    return entities
@@ -10,14 +10,16 @@ _LOGGER: Logger = getLogger(__package__)
 DOMAIN: Final = "smart_controller"
 NAME: Final = "Smart Controller"
 
-IGNORE_STATES: Final = (STATE_UNKNOWN, STATE_UNAVAILABLE)
-ON_OFF_STATES: Final = (STATE_ON, STATE_OFF)
+IGNORE_STATES: Final = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE})
+ON_OFF_STATES: Final = frozenset({STATE_ON, STATE_OFF})
 
 GRAMS_PER_CUBIC_METER: Final = "g/m³"
 
 DEFAULT_CEILING_SSI_MIN_FAHRENHEIT: Final = 81.0
 DEFAULT_CEILING_SSI_MAX_FAHRENHEIT: Final = 91.0
 
+DEFAULT_POLL_INTERVAL_SECONDS: Final = 600
+
 DEFAULT_EXHAUST_FALLING_THRESHOLD: Final = 0.5
 DEFAULT_EXHAUST_RISING_THRESHOLD: Final = 2.0
 DEFAULT_EXHAUST_MANUAL_MINUTES: Final = 15.0
@@ -1,8 +1,12 @@
 """BlueprintEntity class."""
 from __future__ import annotations
 
+import asyncio
+from functools import cached_property
+from typing import Final
+
 from homeassistant.const import ATTR_SW_VERSION
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.loader import async_get_custom_components
@@ -10,23 +14,53 @@ from homeassistant.loader import async_get_custom_components
 from .const import DOMAIN, NAME
 from .smart_controller import SmartController
 
+_SW_VERSION_KEY: Final = f"{DOMAIN}_sw_version"
+
+
+async def async_get_sw_version(hass: HomeAssistant) -> str | None:
+    """Return the integration version, scanning the manifests only once.
+
+    Platforms resolve this before creating entities so the device is
+    registered with its version; the first caller kicks off the lookup
+    and the rest await the shared future.
+    """
+    future: asyncio.Future[str | None] | None = hass.data.get(_SW_VERSION_KEY)
+    if future is None:
+        future = hass.data[_SW_VERSION_KEY] = hass.loop.create_future()
+        try:
+            custom_components = await async_get_custom_components(hass)
+        except BaseException as err:
+            # let a later entity retry instead of caching the failure
+            del hass.data[_SW_VERSION_KEY]
+            future.set_exception(err)
+            raise
+        version = custom_components[DOMAIN].version
+        future.set_result(version.string if version else None)
+    return await future
+
 
 class SmartControllerEntity(Entity):
     """SmartControllerEntity class."""
 
-    def __init__(self, controller: SmartController) -> None:
+    def __init__(self, controller: SmartController, sw_version: str | None) -> None:
         """Initialize."""
-        unique_id = controller.config_entry.entry_id
         self.hass = controller.hass
         self.controller = controller
-        self._attr_unique_id = unique_id
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, unique_id)},
+        self._attr_unique_id = controller.config_entry.entry_id
+        self._sw_version = sw_version
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device info, built lazily on first access."""
+        info = DeviceInfo(
+            identifiers={(DOMAIN, self._attr_unique_id)},
             entry_type=DeviceEntryType.SERVICE,
             name=NAME,
             manufacturer=NAME,
         )
-        self.hass.async_create_task(self._set_sw_version())
+        if self._sw_version is not None:
+            info[ATTR_SW_VERSION] = self._sw_version
+        return info
 
     async def async_added_to_hass(self) -> None:
         """Set up a listener and load data."""
@@ -38,12 +72,8 @@ class SmartControllerEntity(Entity):
     @callback
     def _update_callback(self) -> None:
         """Load data from controller."""
-        self._attr_state = self.controller.state
+        new_state = self.controller.state
+        if new_state == self._attr_state:
+            return
+        self._attr_state = new_state
         self.async_write_ha_state()
-
-    async def _set_sw_version(self) -> None:
-        assert self.device_info
-
-        custom_components = await async_get_custom_components(self.hass)
-        if version := custom_components[DOMAIN].version:
-            self.device_info[ATTR_SW_VERSION] = version.string
@@ -40,6 +40,8 @@ ON_STATES: Final = [
 class OccupancyController(SmartController):
     """Representation of an Occupancy Controller."""
 
+    emits_service_calls = False
+
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the Occupancy Controller."""
         super().__init__(hass, config_entry, initial_state=MyState.UNOCCUPIED)
@@ -1,80 +1,126 @@
 """Base class for controllers."""
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Mapping
+from logging import DEBUG
+from collections.abc import Callable, Collection, Mapping
 from datetime import datetime, timedelta
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_ID, STATE_ON
-from homeassistant.core import CALLBACK_TYPE, Context, Event, HomeAssistant, State
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers.event import (
-    async_track_point_in_utc_time,
+    async_call_later,
     async_track_state_change_event,
 )
-from homeassistant.util import dt
 
 from .const import _LOGGER, IGNORE_STATES, Config
 
-
-class MyContext(Context):
-    """Makes it possible to identify state changes triggered by our service calls."""
+# Recent service-call context ids from every controller, used to filter
+# out state changes triggered by any controller's service calls (one
+# controller may track an entity another controller drives). A dict is
+# used as an insertion-ordered set so old ids can be trimmed FIFO.
+_RECENT_CONTEXT_IDS: dict[str, None] = {}
+_MAX_TRACKED_CONTEXTS: Final = 64
 
 
 class SmartController(ABC):
     """Base class for controllers."""
 
+    # Controllers that never issue service calls can skip the per-event
+    # context check entirely; set to False in those subclasses.
+    emits_service_calls: bool = True
+
+    # no per-instance __dict__; subclasses that declare their own
+    # __slots__ share the memory savings, the rest fall back to a dict
+    __slots__ = (
+        "hass",
+        "config_entry",
+        "_state",
+        "data",
+        "controlled_entity",
+        "_service_target",
+        "name",
+        "tracked_entity_ids",
+        "_timer_unsub",
+        "_unsubscribers",
+        "_listeners",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
-        initial_state: str,
+        initial_state: Any,
     ) -> None:
         """Initialize the controller base."""
 
         self.hass = hass
         self.config_entry = config_entry
         self._state = initial_state
-        self.data: Mapping[str, Any] = config_entry.data | config_entry.options
+        # merge once; the proxy keeps reads at plain dict speed without
+        # allowing anyone to mutate the merged mapping afterwards
+        self.data: Mapping[str, Any] = MappingProxyType(
+            {**config_entry.data, **config_entry.options}
+        )
         self.controlled_entity: str | None = self.data.get(Config.CONTROLLED_ENTITY)
+        # shared read-only target for every service call this controller makes
+        self._service_target: dict[str, Any] = {ATTR_ENTITY_ID: self.controlled_entity}
         self.name: str | None = None
-        self.tracked_entity_ids: list[str] = []
+        self.tracked_entity_ids: Collection[str] = ()
         self._timer_unsub: CALLBACK_TYPE | None = None
-        self._unsubscribers: list[CALLBACK_TYPE] = []
+        # created lazily on first subscription; many controllers never
+        # get past construction on reload paths
+        self._unsubscribers: set[CALLBACK_TYPE] | None = None
         self._listeners: list[CALLBACK_TYPE] = []
 
     async def async_setup(self, hass) -> None:
         """Subscribe to state change events for all tracked entities."""
-        for entity_id in self.tracked_entity_ids:
-            state = hass.states.get(entity_id)
-            if state is not None:
+        # dedupe while preserving order so no entity is processed or
+        # subscribed to twice
+        tracked_entity_ids = list(dict.fromkeys(self.tracked_entity_ids))
+
+        states_get = hass.states.get
+        initial_states: list[State] = []
+        for entity_id in tracked_entity_ids:
+            if (state := states_get(entity_id)) is not None:
                 if self.name is None and entity_id == self.controlled_entity:
                     self.name = state.name
-                await self._on_state_change(None, state)
+                initial_states.append(state)
             else:
                 _LOGGER.warning(
                     "%s; referenced entity '%s' is missing.", self.name, entity_id
                 )
 
-        async def on_state_event(event: Event) -> None:
-            # ignore state change events triggered by service calls from derived controllers
-            if not isinstance(event.context, MyContext):
-                await self._on_state_change(
-                    event.data["old_state"], event.data["new_state"]
-                )
+        await asyncio.gather(
+            *(self._on_state_change(None, state) for state in initial_states)
+        )
 
-        self._unsubscribers.append(
+        self._add_unsubscriber(
             async_track_state_change_event(
-                hass, self.tracked_entity_ids, on_state_event
+                hass,
+                tracked_entity_ids,
+                self._on_state_event
+                if self.emits_service_calls
+                else self._on_any_state_event,
             )
         )
 
     def async_unload(self) -> None:
         """Call when controller is being unloaded."""
-        while self._unsubscribers:
-            unsubscriber = self._unsubscribers.pop()
-            unsubscriber()
+        if self._unsubscribers is not None:
+            while self._unsubscribers:
+                self._unsubscribers.pop()()
 
     def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
         """Listen for data updates."""
@@ -87,7 +133,7 @@ class SmartController(ABC):
         return remove_listener
 
     @property
-    def state(self) -> str:
+    def state(self) -> Any:
         """Return the state."""
         return self._state
 
@@ -105,40 +151,39 @@ class SmartController(ABC):
 
     def set_timer(self, period: timedelta | None) -> None:
         """Start a timer or cancel a timer if time period is 'None'."""
-
-        def timer_expired(_: datetime) -> None:
-            self._timer_unsub = None
-            self.hass.add_job(self.on_timer_expired)
-
         if self._timer_unsub is not None:
-            self._unsubscribers.remove(self._timer_unsub)
+            if self._unsubscribers is not None:
+                self._unsubscribers.discard(self._timer_unsub)
             self._timer_unsub()
             self._timer_unsub = None
-            _LOGGER.debug("%s; state=%s; canceled timer", self.name, self._state)
+            if _LOGGER.isEnabledFor(DEBUG):
+                _LOGGER.debug("%s; state=%s; canceled timer", self.name, self._state)
 
         if period is not None:
-            self._timer_unsub = async_track_point_in_utc_time(
-                self.hass, timer_expired, dt.utcnow() + period
-            )
-            self._unsubscribers.append(self._timer_unsub)
-            _LOGGER.debug(
-                "%s; state=%s; started timer for '%s'",
-                self.name,
-                self._state,
-                period,
+            self._timer_unsub = async_call_later(
+                self.hass, period.total_seconds(), self._timer_expired
             )
+            self._add_unsubscriber(self._timer_unsub)
+            if _LOGGER.isEnabledFor(DEBUG):
+                _LOGGER.debug(
+                    "%s; state=%s; started timer for '%s'",
+                    self.name,
+                    self._state,
+                    period,
+                )
 
-    def set_state(self, new_state: str):
+    def set_state(self, new_state: Any):
         """Change the current state."""
         if self._state == new_state:
             return
 
-        _LOGGER.debug(
-            "%s; state=%s; changing state to '%s'",
-            self.name,
-            self._state,
-            new_state,
-        )
+        if _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug(
+                "%s; state=%s; changing state to '%s'",
+                self.name,
+                self._state,
+                new_state,
+            )
         self._state = new_state
         self._update_listeners()
 
@@ -156,12 +201,13 @@ class SmartController(ABC):
 
     async def fire_event(self, event: Any) -> None:
         """Fire an event to the controller."""
-        _LOGGER.debug(
-            "%s; state=%s; processing '%s' event",
-            self.name,
-            self._state,
-            event,
-        )
+        if _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug(
+                "%s; state=%s; processing '%s' event",
+                self.name,
+                self._state,
+                event,
+            )
         await self.on_event(event)
 
     async def async_service_call(
@@ -172,24 +218,67 @@ class SmartController(ABC):
     ) -> bool | None:
         """Call a service."""
 
-        _LOGGER.debug(
-            "%s; state=%s; calling '%s.%s' service",
-            self.name,
-            self._state,
-            domain,
-            service,
-        )
+        if _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug(
+                "%s; state=%s; calling '%s.%s' service",
+                self.name,
+                self._state,
+                domain,
+                service,
+            )
+
+        context = Context()
+        _RECENT_CONTEXT_IDS[context.id] = None
+        while len(_RECENT_CONTEXT_IDS) > _MAX_TRACKED_CONTEXTS:
+            del _RECENT_CONTEXT_IDS[next(iter(_RECENT_CONTEXT_IDS))]
 
         return await self.hass.services.async_call(
             domain,
             service,
             service_data,
-            target={ATTR_ENTITY_ID: self.controlled_entity},
-            context=MyContext(),
+            target=self._service_target,
+            context=context,
         )
 
     # #### Internal methods ####
 
+    def _add_unsubscriber(self, unsubscriber: CALLBACK_TYPE) -> None:
+        if self._unsubscribers is None:
+            self._unsubscribers = set()
+        self._unsubscribers.add(unsubscriber)
+
+    @callback
+    def _on_state_event(self, event: Event) -> None:
+        # ignore state change events triggered by any controller's service calls
+        if event.context.id not in _RECENT_CONTEXT_IDS:
+            self._on_any_state_event(event)
+
+    @callback
+    def _on_any_state_event(self, event: Event) -> None:
+        # filter synchronously so discarded events never cost a coroutine
+        old_state: State | None = event.data["old_state"]
+        new_state: State | None = event.data["new_state"]
+        if (
+            new_state is None
+            or new_state.state in IGNORE_STATES
+            or (old_state is not None and old_state.state == new_state.state)
+        ):
+            return
+        if _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug(
+                "%s; state=%s; %s changed from '%s' to '%s'",
+                self.name,
+                self._state,
+                new_state.name,
+                old_state.state if old_state else None,
+                new_state.state,
+            )
+        self.hass.async_create_task(self.on_state_change(new_state))
+
+    def _timer_expired(self, _: datetime) -> None:
+        self._timer_unsub = None
+        self.hass.add_job(self.on_timer_expired)
+
     def _update_listeners(self) -> None:
         """Update all registered listeners."""
         for update_callback in self._listeners:
@@ -1,24 +1,20 @@
 """Utility functions."""
 
-from collections.abc import Iterable
 from math import e
 
 from homeassistant import util
 from homeassistant.const import (
-    ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers import entity_registry
 from homeassistant.util.percentage import (
     percentage_to_ranged_value,
     ranged_value_to_percentage,
 )
 from homeassistant.util.unit_conversion import TemperatureConverter
 
-from .const import ON_OFF_STATES
 
 
 def absolute_humidity(temp: tuple[float, str], hum: float):
@@ -72,61 +68,3 @@ def extrapolate_value(
     )
 
     return min(target_range[1], max(target_range[0], target_value))
-
-
-def domain_entities(
-    hass: HomeAssistant,
-    domains: Iterable[str],
-    device_classes: str | Iterable[str | None] | None = None,
-    units_of_measurement: str | Iterable[str | None] | None = None,
-) -> set[str]:
-    """Get list of matching entities."""
-
-    if isinstance(device_classes, str):
-        device_classes = [device_classes]
-
-    if isinstance(units_of_measurement, str):
-        units_of_measurement = [units_of_measurement]
-
-    entity_ids = set()
-    ent_reg = entity_registry.async_get(hass)
-
-    for state in hass.states.async_all(domains):
-        entity = ent_reg.async_get(state.entity_id)
-        if entity and entity.hidden:
-            continue
-
-        if (
-            device_classes
-            and state.attributes.get(ATTR_DEVICE_CLASS) not in device_classes
-        ):
-            continue
-
-        if (
-            units_of_measurement
-            and state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            not in units_of_measurement
-        ):
-            continue
-
-        entity_ids.add(state.entity_id)
-
-    return entity_ids
-
-
-def on_off_entities(
-    hass: HomeAssistant,
-    excluded_domains: Iterable[str],
-) -> set[str]:
-    """Get list of entities with on/off state."""
-
-    entity_ids = set()
-    ent_reg = entity_registry.async_get(hass)
-
-    for state in hass.states.async_all():
-        if state.domain not in excluded_domains and state.state in ON_OFF_STATES:
-            entity = ent_reg.async_get(state.entity_id)
-            if entity is None or not entity.hidden:
-                entity_ids.add(state.entity_id)
-
-    return entity_ids